@@ -0,0 +1,526 @@
+"""
+Report Builder
+==============
+Regenerate the static report figures under visuals/eda/ without re-running
+the notebooks.
+
+Each figure is keyed on a SHA-256 hash of its input columns, its parameters
+and the source of its render function. Figures whose key matches the cache
+manifest (visuals/eda/.figure_cache.json) and whose PNG is still on disk are
+skipped; stale figures are rendered in parallel worker processes.
+
+Usage:
+    python scripts/build_report.py              # render only what changed
+    python scripts/build_report.py --force      # re-render everything
+    python scripts/build_report.py --jobs 2     # limit worker processes
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')  # workers never need a display
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = PROJECT_DIR / 'data' / 'processed'
+OUTPUT_DIR = PROJECT_DIR / 'visuals' / 'eda'
+CACHE_PATH = OUTPUT_DIR / '.figure_cache.json'
+
+# Same setup as notebooks/5_modeling.ipynb
+FEATURE_COLUMNS = [
+    'Year',
+    'Month',
+    'Quarter',
+    'Stage_Order',
+    'Investor_Count',
+    'City_Category_Encoded',
+    'Industry_Category_Encoded',
+    'Has_Multiple_Investors'
+]
+TARGET_COLUMN = 'Funding_Amount_Log'
+MODEL_PARAMS = {
+    'test_size': 0.2,
+    'random_state': 42,
+    'rf': {
+        'n_estimators': 100,
+        'max_depth': 10,
+        'min_samples_split': 20,
+        'min_samples_leaf': 10,
+        'random_state': 42
+    }
+}
+
+
+# ---------------------------------------------------------------------------
+# Styles (match the notebook that originally produced each figure)
+# ---------------------------------------------------------------------------
+
+def apply_style(style):
+    """Apply the plotting style of the notebook a figure comes from."""
+    if style == 'eda':
+        plt.style.use('seaborn-v0_8-darkgrid')
+        sns.set_palette("husl")
+        plt.rcParams['figure.figsize'] = (12, 6)
+        plt.rcParams['font.size'] = 10
+    elif style == 'modeling':
+        sns.set_style('whitegrid')
+        plt.rcParams['figure.figsize'] = (10, 6)
+    else:
+        raise ValueError(f"Unknown style: {style}")
+
+
+# ---------------------------------------------------------------------------
+# Figure renderers (3_eda.ipynb)
+# ---------------------------------------------------------------------------
+
+def render_city_analysis(data, params):
+    """Top cities by total funding and by startup count."""
+    city_stats = data.groupby('City_Clean').agg({
+        'Amount_Crores': 'sum',
+        'Startup Name': 'count'
+    }).round(2)
+    city_stats.columns = ['Total_Funding_Cr', 'Startup_Count']
+    city_stats = city_stats.sort_values('Total_Funding_Cr', ascending=False).head(params['top_n'])
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+
+    city_stats['Total_Funding_Cr'].plot(kind='barh', ax=ax1, color='teal')
+    ax1.set_xlabel('Total Funding (Crores)')
+    ax1.set_title(f"Top {params['top_n']} Cities by Total Funding")
+    ax1.invert_yaxis()
+
+    city_stats['Startup_Count'].plot(kind='barh', ax=ax2, color='coral')
+    ax2.set_xlabel('Number of Startups')
+    ax2.set_title(f"Top {params['top_n']} Cities by Startup Count")
+    ax2.invert_yaxis()
+
+    plt.tight_layout()
+    return fig
+
+
+def render_stage_boxplot(data, params):
+    """Funding amount distribution by stage (excluding Undisclosed)."""
+    df_stage = data[data['Stage'] != 'Undisclosed']
+
+    fig = plt.figure(figsize=(14, 6))
+    sns.boxplot(data=df_stage, x='Stage', y='Amount_Crores',
+                order=df_stage.groupby('Stage')['Stage_Order'].first().sort_values().index)
+    plt.xticks(rotation=45, ha='right')
+    plt.xlabel('Funding Stage')
+    plt.ylabel('Funding Amount (Crores)')
+    plt.title('Distribution of Funding Amounts by Stage')
+    plt.tight_layout()
+    return fig
+
+
+def render_investor_count_analysis(data, params):
+    """Funding amount by number of investors."""
+    df_inv = data[(data['Investor_Count'] > 0) & (data['Investor_Count'] <= params['max_investors'])]
+
+    fig = plt.figure(figsize=(12, 6))
+    sns.boxplot(data=df_inv, x='Investor_Count', y='Amount_Crores')
+    plt.xlabel('Number of Investors')
+    plt.ylabel('Funding Amount (Crores)')
+    plt.title('Funding Amount by Investor Count')
+    plt.tight_layout()
+    return fig
+
+
+def render_correlation_heatmap(data, params):
+    """Correlation heatmap of the numerical columns."""
+    correlation_matrix = data.dropna().corr()
+
+    fig = plt.figure(figsize=(10, 8))
+    sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
+                square=True, linewidths=1, cbar_kws={"shrink": 0.8})
+    plt.title('Correlation Heatmap of Numerical Features')
+    plt.tight_layout()
+    return fig
+
+
+def render_amount_distribution(data, params):
+    """Histogram of funding amounts on the original and log scale."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+
+    data['Amount_Crores'].dropna().plot(kind='hist', bins=params['bins'], ax=ax1, alpha=0.7,
+                                        color='skyblue', edgecolor='black')
+    ax1.set_xlabel('Funding Amount (Crores)')
+    ax1.set_ylabel('Frequency')
+    ax1.set_title('Distribution of Funding Amounts (Original Scale)')
+
+    data['Funding_Amount_Log'].dropna().plot(kind='hist', bins=params['bins'], ax=ax2, alpha=0.7,
+                                             color='salmon', edgecolor='black')
+    ax2.set_xlabel('Log(Funding Amount)')
+    ax2.set_ylabel('Frequency')
+    ax2.set_title('Distribution of Funding Amounts (Log Scale)')
+
+    plt.tight_layout()
+    return fig
+
+
+# ---------------------------------------------------------------------------
+# Figure renderers (5_modeling.ipynb)
+# ---------------------------------------------------------------------------
+
+def render_lr_coefficients(data, params):
+    """Linear Regression coefficients sorted by magnitude."""
+    coefficients = pd.DataFrame({
+        'Feature': data['feature_names'],
+        'Coefficient': data['lr_coef']
+    }).sort_values('Coefficient', key=abs, ascending=False)
+
+    fig = plt.figure(figsize=(10, 6))
+    plt.barh(coefficients['Feature'], coefficients['Coefficient'])
+    plt.xlabel('Coefficient Value')
+    plt.title('Linear Regression Feature Coefficients')
+    plt.tight_layout()
+    return fig
+
+
+def render_rf_feature_importance(data, params):
+    """Random Forest feature importance."""
+    importance = pd.DataFrame({
+        'Feature': data['feature_names'],
+        'Importance': data['rf_importance']
+    }).sort_values('Importance', ascending=False)
+
+    fig = plt.figure(figsize=(10, 6))
+    plt.barh(importance['Feature'], importance['Importance'])
+    plt.xlabel('Importance Score')
+    plt.title('Random Forest Feature Importance')
+    plt.tight_layout()
+    return fig
+
+
+def render_model_predictions(data, params):
+    """Random Forest actual vs predicted on the test set."""
+    y_test = data['y_test']
+    y_pred = data['y_test_pred_rf']
+
+    fig = plt.figure(figsize=(10, 6))
+    plt.scatter(y_test, y_pred, alpha=0.5, s=30, color='green')
+    plt.plot([y_test.min(), y_test.max()], [y_test.min(), y_test.max()], 'r--', lw=2)
+    plt.xlabel('Actual Log(Amount)')
+    plt.ylabel('Predicted Log(Amount)')
+    plt.title(f"Random Forest: Actual vs Predicted\nR² = {data['rf_test_r2']:.4f}")
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+
+def render_residual_analysis(data, params):
+    """Random Forest residuals vs predicted and residual histogram."""
+    y_pred = data['y_test_pred_rf']
+    residuals_rf = data['y_test'] - y_pred
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+
+    axes[0].scatter(y_pred, residuals_rf, alpha=0.5, s=30, color='purple')
+    axes[0].axhline(y=0, color='r', linestyle='--', lw=2)
+    axes[0].set_xlabel('Predicted Log(Amount)')
+    axes[0].set_ylabel('Residuals')
+    axes[0].set_title('Residual Plot (Random Forest)')
+    axes[0].grid(True, alpha=0.3)
+
+    axes[1].hist(residuals_rf, bins=params['bins'], color='purple', alpha=0.7, edgecolor='black')
+    axes[1].set_xlabel('Residuals')
+    axes[1].set_ylabel('Frequency')
+    axes[1].set_title('Residual Distribution')
+    axes[1].axvline(x=0, color='r', linestyle='--', lw=2)
+    axes[1].grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    return fig
+
+
+# ---------------------------------------------------------------------------
+# Figure registry
+# ---------------------------------------------------------------------------
+# source:  'clean' -> startup_funding_clean.csv, 'features' -> processed_features.csv,
+#          'model' -> outputs of train_models()
+# columns: the only inputs the renderer sees (and the only ones hashed)
+
+FIGURES = [
+    {
+        'name': 'city_analysis',
+        'source': 'clean',
+        'columns': ['City_Clean', 'Amount_Crores', 'Startup Name'],
+        'params': {'style': 'eda', 'dpi': 300, 'top_n': 10},
+        'render': render_city_analysis,
+    },
+    {
+        'name': 'stage_boxplot',
+        'source': 'clean',
+        'columns': ['Stage', 'Stage_Order', 'Amount_Crores'],
+        'params': {'style': 'eda', 'dpi': 300},
+        'render': render_stage_boxplot,
+    },
+    {
+        'name': 'investor_count_analysis',
+        'source': 'clean',
+        'columns': ['Investor_Count', 'Amount_Crores'],
+        'params': {'style': 'eda', 'dpi': 300, 'max_investors': 10},
+        'render': render_investor_count_analysis,
+    },
+    {
+        'name': 'correlation_heatmap',
+        'source': 'clean',
+        'columns': ['Year', 'Quarter', 'Stage_Order', 'Amount_Crores', 'Investor_Count'],
+        'params': {'style': 'eda', 'dpi': 300},
+        'render': render_correlation_heatmap,
+    },
+    {
+        'name': 'amount_distribution',
+        'source': 'clean',
+        'columns': ['Amount_Crores', 'Funding_Amount_Log'],
+        'params': {'style': 'eda', 'dpi': 300, 'bins': 50},
+        'render': render_amount_distribution,
+    },
+    {
+        'name': 'lr_coefficients',
+        'source': 'model',
+        'columns': ['feature_names', 'lr_coef'],
+        'params': {'style': 'modeling', 'dpi': 150},
+        'render': render_lr_coefficients,
+    },
+    {
+        'name': 'rf_feature_importance',
+        'source': 'model',
+        'columns': ['feature_names', 'rf_importance'],
+        'params': {'style': 'modeling', 'dpi': 150},
+        'render': render_rf_feature_importance,
+    },
+    {
+        'name': 'model_predictions',
+        'source': 'model',
+        'columns': ['y_test', 'y_test_pred_rf', 'rf_test_r2'],
+        'params': {'style': 'modeling', 'dpi': 150},
+        'render': render_model_predictions,
+    },
+    {
+        'name': 'residual_analysis',
+        'source': 'model',
+        'columns': ['y_test', 'y_test_pred_rf'],
+        'params': {'style': 'modeling', 'dpi': 150, 'bins': 30},
+        'render': render_residual_analysis,
+    },
+]
+
+
+# ---------------------------------------------------------------------------
+# Model training (only runs when a model figure is stale)
+# ---------------------------------------------------------------------------
+
+def model_inputs(df):
+    """Rows and columns the models are trained on, as in 5_modeling.ipynb."""
+    df_model = df.dropna(subset=[TARGET_COLUMN])
+    df_model = df_model[~df_model[FEATURE_COLUMNS].isnull().any(axis=1)]
+    return df_model[FEATURE_COLUMNS + [TARGET_COLUMN]]
+
+
+def train_models(df_model):
+    """Fit Linear Regression and Random Forest and collect what the plots need."""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import train_test_split
+
+    X = df_model[FEATURE_COLUMNS]
+    y = df_model[TARGET_COLUMN]
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=MODEL_PARAMS['test_size'], random_state=MODEL_PARAMS['random_state']
+    )
+
+    lr_model = LinearRegression()
+    lr_model.fit(X_train, y_train)
+
+    rf_model = RandomForestRegressor(n_jobs=-1, **MODEL_PARAMS['rf'])
+    rf_model.fit(X_train, y_train)
+    y_test_pred_rf = rf_model.predict(X_test)
+
+    return {
+        'feature_names': list(FEATURE_COLUMNS),
+        'lr_coef': lr_model.coef_,
+        'rf_importance': rf_model.feature_importances_,
+        'y_test': y_test.to_numpy(),
+        'y_test_pred_rf': y_test_pred_rf,
+        'rf_test_r2': r2_score(y_test, y_test_pred_rf),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Cache keys
+# ---------------------------------------------------------------------------
+
+def frame_digest(df):
+    """Hash the values, index and column names of a DataFrame."""
+    h = hashlib.sha256()
+    h.update(json.dumps(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def figure_key(spec, source_digests):
+    """
+    Cache key for one figure.
+
+    Covers the figure's input columns (or, for model figures, the training
+    data and model parameters), its params and the source of its renderer,
+    so editing a plot function also invalidates its PNG.
+    """
+    h = hashlib.sha256()
+    h.update(source_digests[spec['name']].encode())
+    h.update(json.dumps(spec['columns']).encode())
+    h.update(json.dumps(spec['params'], sort_keys=True).encode())
+    h.update(inspect.getsource(spec['render']).encode())
+    h.update(inspect.getsource(apply_style).encode())
+    return h.hexdigest()
+
+
+def load_cache():
+    """Read the figure -> key manifest (empty if missing or unreadable)."""
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    """Write the manifest atomically so an interrupted run cannot corrupt it."""
+    tmp_path = CACHE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def render_figure(render, data, params, out_path):
+    """Render one figure to PNG (runs in a worker process). Returns seconds taken."""
+    start = time.perf_counter()
+    with plt.rc_context():
+        apply_style(params['style'])
+        fig = render(data, params)
+        fig.savefig(out_path, dpi=params['dpi'], bbox_inches='tight')
+        plt.close(fig)
+    return time.perf_counter() - start
+
+
+def build_report(force=False, jobs=None):
+    """
+    Re-render stale figures and print a per-figure report.
+
+    Returns:
+        list of dict: one row per figure with name, status and seconds
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    df_clean = pd.read_csv(DATA_DIR / 'startup_funding_clean.csv')
+    df_features = pd.read_csv(DATA_DIR / 'processed_features.csv')
+    df_model = model_inputs(df_features)
+    frames = {'clean': df_clean, 'features': df_features}
+
+    model_digest = hashlib.sha256(
+        (frame_digest(df_model) + json.dumps(MODEL_PARAMS, sort_keys=True)
+         + inspect.getsource(model_inputs) + inspect.getsource(train_models)).encode()
+    ).hexdigest()
+
+    source_digests = {}
+    for spec in FIGURES:
+        if spec['source'] == 'model':
+            source_digests[spec['name']] = model_digest
+        else:
+            source_digests[spec['name']] = frame_digest(frames[spec['source']][spec['columns']])
+
+    cache = load_cache()
+    keys = {spec['name']: figure_key(spec, source_digests) for spec in FIGURES}
+    stale = [
+        spec for spec in FIGURES
+        if force
+        or cache.get(spec['name']) != keys[spec['name']]
+        or not (OUTPUT_DIR / f"{spec['name']}.png").exists()
+    ]
+
+    model_outputs = None
+    if any(spec['source'] == 'model' for spec in stale):
+        print("Training models for stale model figures...")
+        model_outputs = train_models(df_model)
+
+    results = {spec['name']: {'status': 'cached', 'seconds': 0.0} for spec in FIGURES}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for spec in stale:
+            if spec['source'] == 'model':
+                data = {col: model_outputs[col] for col in spec['columns']}
+            else:
+                data = frames[spec['source']][spec['columns']]
+            out_path = OUTPUT_DIR / f"{spec['name']}.png"
+            future = pool.submit(render_figure, spec['render'], data, spec['params'], out_path)
+            futures[future] = spec['name']
+
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                seconds = future.result()
+            except Exception as e:
+                print(f"[ERROR] {name}: {e}")
+                results[name] = {'status': 'failed', 'seconds': 0.0}
+                cache.pop(name, None)
+                continue
+            results[name] = {'status': 'rendered', 'seconds': seconds}
+            cache[name] = keys[name]
+
+    save_cache(cache)
+
+    rows = [{'name': spec['name'], **results[spec['name']]} for spec in FIGURES]
+    print_report(rows)
+    return rows
+
+
+def print_report(rows):
+    """Print cache hits and render time per figure."""
+    print("\n" + "="*70)
+    print("REPORT BUILD SUMMARY")
+    print("="*70)
+    print(f"{'Figure':<30}{'Status':<12}{'Render time (s)':>15}")
+    print("-" * 70)
+    for row in rows:
+        seconds = f"{row['seconds']:.2f}" if row['status'] == 'rendered' else '-'
+        print(f"{row['name'] + '.png':<30}{row['status']:<12}{seconds:>15}")
+    print("-" * 70)
+
+    hits = sum(row['status'] == 'cached' for row in rows)
+    rendered = [row for row in rows if row['status'] == 'rendered']
+    print(f"Cache hits: {hits}/{len(rows)}")
+    print(f"Rendered:   {len(rendered)} (total render time {sum(r['seconds'] for r in rendered):.2f}s)")
+    print("="*70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild report figures in visuals/eda/.")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore the cache and re-render every figure")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    rows = build_report(force=args.force, jobs=args.jobs)
+    if any(row['status'] == 'failed' for row in rows):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()